@@ -0,0 +1,396 @@
+"""
+Shared PDF table-extraction pipeline used by interactive.py and
+interactiveupdate.py. The scripts only differ in which section heading
+they search for, so everything else lives here: PyMuPDF-based text
+search, pdfplumber table extraction, and the Excel/CSV writers.
+"""
+
+import copy
+import csv
+import fitz  # PyMuPDF
+import pdfplumber
+import pandas as pd
+import re
+from datetime import datetime
+import os
+import openpyxl
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.utils import get_column_letter
+from openpyxl.styles import PatternFill, Font, Alignment
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+# Year cells look like "2020-21"; compiled once at import
+_YEAR_RE = re.compile(r'\d{4}-\d{2}')
+
+# The target table sits directly below the heading and only has two rows,
+# so a tight crop band keeps pdfplumber's edge detection cheap. Ruled
+# tables are tried first; the text strategy covers borderless ones.
+TABLE_BAND_HEIGHT = 150
+LINE_TABLE_SETTINGS = {
+    "vertical_strategy": "lines",
+    "horizontal_strategy": "lines",
+    "min_words_vertical": 1,
+    "min_words_horizontal": 1,
+}
+TEXT_TABLE_SETTINGS = {
+    "vertical_strategy": "text",
+    "horizontal_strategy": "text",
+}
+
+# The BASIC INFORMATION table appears on page 1 or 2 of every NAAC SSR,
+# so there is no point scanning (or re-scanning) the whole document
+BASIC_INFO = "BASIC INFORMATION"
+_college_name_cache = {}
+
+# Shared style singletons - openpyxl hashes styles on every assignment,
+# so reuse one object per style instead of allocating per cell
+BOLD_FONT = Font(bold=True)
+HEADER_FONT = Font(color='FFFFFF', bold=True)
+HEADER_FILL = PatternFill(start_color='366092', end_color='366092', fill_type='solid')
+CENTER = Alignment(horizontal='center')
+
+def get_college_name(doc):
+    """
+    Extract college name from the BASIC INFORMATION table in the PDF.
+
+    Only the first few pages are scanned, and results are cached per file
+    so repeated lookups for the same PDF never re-parse it.
+
+    Args:
+        doc (fitz.Document): Already-open PyMuPDF document
+
+    Returns:
+        str: College name or None if not found
+    """
+    if doc.name in _college_name_cache:
+        return _college_name_cache[doc.name]
+    try:
+        for page_num in range(min(3, doc.page_count)):
+            page = doc[page_num]
+            text = page.get_text("text")
+            if BASIC_INFO in text:
+                tables = page.find_tables()
+                for table in tables.tables:
+                    # Convert table cells to strings and check if we found the right table
+                    str_table = [[str(cell).strip() if cell is not None else "" for cell in row] for row in table.extract()]
+                    for i, row in enumerate(str_table):
+                        # Look for the row with college name (typically second row)
+                        if i > 0 and len(row) > 1:  # Skip header row
+                            college_name = row[1].strip()
+                            if college_name and college_name.lower() != "name of the college":
+                                _college_name_cache[doc.name] = college_name
+                                return college_name
+    except Exception as e:
+        print(f"Error extracting college name: {str(e)}")
+    _college_name_cache[doc.name] = None
+    return None
+
+def get_pdf_files(folder_path):
+
+    # Walk the tree with os.scandir - DirEntry.is_dir reuses the dirent
+    # type from the directory listing, so no extra stat per entry and no
+    # fnmatch cost per file
+    pdf_files = []
+    stack = [folder_path]
+    while stack:
+        directory = stack.pop()
+        try:
+            with os.scandir(directory) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.name.lower().endswith('.pdf'):
+                        pdf_files.append(entry.path)
+        except OSError as e:
+            print(f"Error scanning {directory}: {str(e)}")
+    pdf_files.sort()
+
+    if not pdf_files:
+        print(f"No PDF files found in: {folder_path}")
+        return []
+
+    print(f"Found {len(pdf_files)} PDF files")
+    return pdf_files
+
+def find_text_and_crop(doc, search_text):
+    """
+    Find the specified text in PDF and return the page number and y-coordinate
+
+    Args:
+        doc (fitz.Document): Already-open PyMuPDF document
+        search_text (re.Pattern): Compiled pattern to search for
+
+    Returns:
+        tuple: (page_number, y_coordinate, found_text) or (None, None, False) if not found
+    """
+    try:
+        for page_num, page in enumerate(doc):
+            # Cheap raw-text scan first; only a matching page pays for
+            # the bounding-box lookup
+            text = page.get_text("text")
+            match = search_text.search(text)
+            if match:
+                rects = page.search_for(match.group(1))
+                if rects:
+                    # rect.y1 is the bottom edge, same convention as pdfplumber's word['bottom']
+                    return page_num, rects[0].y1, True
+    except Exception as e:
+        print(f"Error finding text: {str(e)}")
+    return None, None, False
+
+def _first_valid_table(tables):
+    """Return a DataFrame of the first table whose header is five year cells, else None."""
+    for table in tables:
+        if len(table) >= 2 and len(table[0]) == 5:
+            first_row = table[0]
+            if all(cell is not None and _YEAR_RE.match(str(cell)) for cell in first_row):
+                # Create DataFrame with only first two rows
+                return pd.DataFrame(table[:2])
+    return None
+
+def extract_table_from_cropped_area(pdf, page_num, y_coord=None, check_next_page=False):
+    """
+    Extract the first valid table from the cropped area below the specified y-coordinate
+    or from the beginning of the next page
+
+    Args:
+        pdf (pdfplumber.PDF): Already-open PDF object
+        page_num (int): Page number containing the table
+        y_coord (float, optional): Y-coordinate to crop from
+        check_next_page (bool): Whether to check the next page from top
+
+    Returns:
+        tuple: (DataFrame, section_number) or (None, None) if no valid table found
+    """
+    try:
+        if page_num >= len(pdf.pages):
+            return None, None
+
+        page = pdf.pages[page_num]
+
+        # For the next page we check from the top, otherwise from y_coord
+        band_top = 0 if check_next_page else y_coord
+
+        # Try a tight band below the heading with constrained strategies first
+        band_bottom = min(band_top + TABLE_BAND_HEIGHT, page.height)
+        band = page.crop((0, band_top, page.width, band_bottom))
+        for table_settings in (LINE_TABLE_SETTINGS, TEXT_TABLE_SETTINGS):
+            df = _first_valid_table(band.extract_tables(table_settings=table_settings))
+            if df is not None:
+                return df, None
+
+        # Last resort: scan the full area below the heading with default settings
+        cropped_page = page.crop((0, band_top, page.width, page.height))
+        df = _first_valid_table(cropped_page.extract_tables())
+        if df is not None:
+            return df, None
+
+    except Exception as e:
+        print(f"Error extracting table: {str(e)}")
+    return None, None
+
+def extract_enrollment_table(doc, pdf_path, pattern):
+    """
+    Extract the target table using text search and page cropping.
+    If the heading is found near the bottom of a page, the next page is
+    also checked for the table.
+
+    The text search runs on the already-open PyMuPDF document; pdfplumber
+    is only opened when a match is found and a table actually needs extracting.
+
+    Returns tuple: (DataFrame, section_found)
+    where section_found is True if the heading was found, even when table
+    extraction failed
+    """
+    # Find text and get coordinates
+    page_num, y_coord, section_found = find_text_and_crop(doc, pattern)
+
+    if page_num is not None and y_coord is not None:
+        print(f"Found target text at page {page_num + 1}, y-coordinate {y_coord}")
+
+        # Open pdfplumber once and reuse it for the next-page fallback too
+        with pdfplumber.open(pdf_path) as pdf:
+            # First try to extract table from current page
+            df, _ = extract_table_from_cropped_area(pdf, page_num, y_coord)
+
+            # If table not found and y_coord is near bottom of page (>= 700), check next page
+            if df is None and y_coord >= 700:
+                print(f"Heading found near bottom of page {page_num + 1}, checking next page...")
+                df, _ = extract_table_from_cropped_area(pdf, page_num + 1, check_next_page=True)
+                if df is not None:
+                    print(f"Successfully found table on page {page_num + 2}")
+
+        return df, section_found
+
+    return None, False
+
+def _styled_cell(worksheet, value, font=None, fill=None):
+    """Build a centered WriteOnlyCell with optional font/fill."""
+    cell = WriteOnlyCell(worksheet, value=value)
+    cell.alignment = CENTER
+    if font is not None:
+        cell.font = font
+    if fill is not None:
+        cell.fill = fill
+    return cell
+
+def save_to_excel(dataframes, output_path):
+    """
+    Save the data to Excel with colleges in first row and table data in second row.
+
+    Uses openpyxl's write-only mode (streamed through lxml when installed)
+    so cells are serialized as they are appended instead of being kept in memory.
+    """
+    workbook = openpyxl.Workbook(write_only=True)
+    worksheet = workbook.create_sheet("College Data")
+
+    default_years = ['2020-21', '2019-20', '2018-19', '2017-18', '2016-17']
+
+    # Styled default cells are identical for every college block, so build
+    # the templates once and copy them per block (copy.copy is a cheap
+    # shallow copy; the style objects stay shared)
+    default_year_cells = [_styled_cell(worksheet, year, font=HEADER_FONT, fill=HEADER_FILL)
+                          for year in default_years]
+    blank_cell = _styled_cell(worksheet, None)
+    missing_cell = _styled_cell(worksheet, 'x')
+
+    # Column widths and merged ranges must be declared before rows are appended
+    for col in range(1, 5 * len(dataframes) + 1):
+        worksheet.column_dimensions[get_column_letter(col)].width = 15
+    for block in range(len(dataframes)):
+        start = get_column_letter(block * 5 + 1)
+        end = get_column_letter(block * 5 + 5)
+        worksheet.merged_cells.ranges.add(f"{start}1:{end}1")
+
+    name_row = []
+    year_row = []
+    value_row = []
+    for pdf_path, (college_name, df, section_found) in dataframes.items():
+        college_name = college_name or os.path.splitext(os.path.basename(pdf_path))[0]
+
+        # College name followed by four blanks covered by the merged range
+        name_row.append(_styled_cell(worksheet, college_name, font=BOLD_FONT))
+        name_row.extend([None] * 4)
+
+        if df is not None and not df.empty:
+            for value in df.iloc[0]:
+                year_row.append(_styled_cell(worksheet, value, font=HEADER_FONT, fill=HEADER_FILL))
+            if len(df) > 1:
+                for value in df.iloc[1]:
+                    value_row.append(_styled_cell(worksheet, value))
+            else:
+                value_row.extend([None] * 5)
+        else:
+            # Default year labels; leave the values blank if the section was
+            # found (table just failed to extract), otherwise mark with 'x'
+            value_template = blank_cell if section_found else missing_cell
+            year_row.extend(copy.copy(cell) for cell in default_year_cells)
+            value_row.extend(copy.copy(value_template) for _ in default_years)
+
+    worksheet.append(name_row)
+    worksheet.append(year_row)
+    worksheet.append(value_row)
+    workbook.save(output_path)
+
+def create_concatenated_csv(dataframes, all_pdf_files, output_dir):
+    """
+    Create a concatenated CSV with all college data side by side.
+
+    Accumulates three plain row lists (college names, years, values) and
+    writes them with csv.writer in one pass - the payload is only three
+    rows, so pandas would be pure overhead here.
+    """
+    template_columns = ['2020-21', '2019-20', '2018-19', '2017-18', '2016-17']
+
+    name_row = []
+    year_row = []
+    value_row = []
+    for pdf_path in all_pdf_files:
+        college_name = None
+        if pdf_path in dataframes:
+            college_name = dataframes[pdf_path][0]
+        college_name = college_name or os.path.splitext(os.path.basename(pdf_path))[0]
+
+        if pdf_path in dataframes and dataframes[pdf_path][1] is not None:
+            df = dataframes[pdf_path][1]
+            years = list(df.iloc[0])
+            values = list(df.iloc[1]) if len(df) > 1 else [''] * len(years)
+        else:
+            years = template_columns
+            values = [''] * len(template_columns)
+
+        name_row.extend([college_name] * len(years))
+        year_row.extend(years)
+        value_row.extend(values)
+
+    if name_row:
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        csv_path = os.path.join(output_dir, f'criteria_{timestamp}.csv')
+        with open(csv_path, 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(name_row)
+            writer.writerow(year_row)
+            writer.writerow(value_row)
+        return csv_path
+    return None
+
+def _process_one(pdf_path, pattern):
+    """
+    Process a single PDF in a worker process.
+
+    Returns:
+        tuple: (college_name, DataFrame or None, section_found)
+    """
+    try:
+        print(f"Processing: {pdf_path}")
+        # Open the PDF once with PyMuPDF and reuse it for every search step
+        with fitz.open(pdf_path) as doc:
+            college_name = get_college_name(doc)
+            df, section_found = extract_enrollment_table(doc, pdf_path, pattern)
+
+        if df is not None:
+            print(f"✓ Successfully extracted table from: {os.path.basename(pdf_path)}")
+        elif section_found:
+            print(f"! Found section but couldn't extract table from: {os.path.basename(pdf_path)}")
+        else:
+            print(f"✗ No matching section found in: {os.path.basename(pdf_path)}")
+        return college_name, df, section_found
+    except Exception as e:
+        print(f"Error processing {pdf_path}: {str(e)}")
+        return None, None, False
+
+def process_folder(input_folder, output_dir, pattern):
+    os.makedirs(output_dir, exist_ok=True)
+    pdf_files = get_pdf_files(input_folder)
+
+    if not pdf_files:
+        return
+
+    # Each PDF is an independent CPU-bound parse, so fan the files out
+    # across worker processes (pdfminer/PyMuPDF hold the GIL too much for threads)
+    results = {}
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        futures = {executor.submit(_process_one, pdf_path, pattern): pdf_path for pdf_path in pdf_files}
+        for future in as_completed(futures):
+            results[futures[future]] = future.result()
+
+    # Keep output columns in the original file order regardless of completion order
+    results = {pdf_path: results[pdf_path] for pdf_path in pdf_files}
+
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    excel_path = os.path.join(output_dir, f'enrollment_data_{timestamp}.xlsx')
+    save_to_excel(results, excel_path)
+    print(f"\nExcel output saved to: {excel_path}")
+
+    # Reuses the college names already stored in results - no PDF is re-opened
+    csv_path = create_concatenated_csv(results, pdf_files, output_dir)
+    if csv_path:
+        print(f"CSV output saved to: {csv_path}")
+
+    print(f"\nProcessing Summary:")
+    print(f"Total PDFs processed: {len(pdf_files)}")
+    successful_extractions = sum(1 for _, (_, df, _) in results.items() if df is not None)
+    sections_found_no_table = sum(1 for _, (_, df, section_found) in results.items() if df is None and section_found)
+    print(f"Successfully extracted tables: {successful_extractions}")
+    print(f"Sections found but tables not extracted: {sections_found_no_table}")
+    print(f"No sections found: {len(pdf_files) - successful_extractions - sections_found_no_table}")